@@ -6,6 +6,9 @@ success, logs = eval_set(
    log_dir="logs/logs-run-1", # set directory
    limit = 1, # set how many samples you want to run
    epochs = 1, # set resampling iterations
+   max_connections = 32, # set concurrent requests per model
+   max_retries = 5, # set retries for rate-limited or failed requests
+   batch = False, # set True to send requests through provider batch APIs (OpenAI, Anthropic, Google)
 )
 
 
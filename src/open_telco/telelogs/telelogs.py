@@ -1,3 +1,5 @@
+from string import ascii_uppercase
+
 from dotenv import load_dotenv
 from inspect_ai import Task, task
 from inspect_ai.dataset import Sample, hf_dataset
@@ -10,11 +12,18 @@ from open_telco.telelogs.utils import maj_at_k
 load_dotenv()
 
 
+def _answer_letter(index: int) -> str:
+    # out-of-range indices keep chr()'s result, which matches no choice
+    if 0 <= index < len(ascii_uppercase):
+        return ascii_uppercase[index]
+    return chr(65 + index)
+
+
 def telelogs_record_to_sample(record):
     return Sample(
         input=record["question"],
         choices=record["choices"],
-        target=chr(65 + record["answer"]),  # Convert 0->A, 1->B, 2->C, etc.
+        target=_answer_letter(record["answer"]),  # Convert 0->A, 1->B, 2->C, etc.
         metadata={}
     )
 
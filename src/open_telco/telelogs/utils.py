@@ -1,4 +1,4 @@
-from collections import Counter, defaultdict
+from collections import defaultdict
 
 from inspect_ai.scorer import SampleScore, Value, metric
 
@@ -17,15 +17,22 @@ def maj_at_k():
 
         correct = 0
         for sample_scores in grouped.values():
-            answers = [s.answer for s in sample_scores if s.answer]
-            if not answers:
+            counts: dict[str, int] = {}
+            scored_correct: set[str] = set()
+            for s in sample_scores:
+                answer = s.answer
+                if not answer:
+                    continue
+                counts[answer] = counts.get(answer, 0) + 1
+                if s.value == 1:
+                    scored_correct.add(answer)
+            if not counts:
                 continue
 
-            majority = Counter(answers).most_common(1)[0][0]
-            correct += any(
-                s.value == 1 and s.answer == majority for s in sample_scores
-            )
+            # max() keeps the first answer seen on ties
+            majority = max(counts, key=counts.__getitem__)
+            correct += majority in scored_correct
 
         return correct / len(grouped)
 
-    return metric_fn
\ No newline at end of file
+    return metric_fn
@@ -6,7 +6,6 @@ from inspect_ai import Task, task
 from inspect_ai.dataset import FieldSpec, hf_dataset
 from inspect_ai.scorer import scorer, accuracy, stderr, Score, Target
 from inspect_ai.solver import generate, system_message, TaskState
- 
 
 load_dotenv()
 
@@ -25,14 +24,46 @@ SYSTEM_PROMPT = dedent(r"""
     """)
 
 
+BOXED_OPEN = "\\boxed{"
+NEWLINE_PATTERN = re.compile(r"\n\s*")
+
+
+def _last_boxed(response: str) -> str | None:
+    """Return the content of the last well-formed \\boxed{...} in response.
+
+    The box may contain one level of nested braces. Candidates are walked
+    left to right, so nested boxes resolve to the outer one.
+    """
+    last = None
+    pos = response.find(BOXED_OPEN)
+    while pos != -1:
+        start = pos + len(BOXED_OPEN)
+        end = -1
+        nested = False
+        for i in range(start, len(response)):
+            char = response[i]
+            if char == "{":
+                if nested:
+                    break
+                nested = True
+            elif char == "}":
+                if not nested:
+                    end = i
+                    break
+                nested = False
+        if end == -1:
+            pos = response.find(BOXED_OPEN, pos + 1)
+        else:
+            last = response[start:end]
+            pos = response.find(BOXED_OPEN, end + 1)
+    return last
+
+
 def parse_answer(response: str) -> str:
-    matches = re.findall(r'\\boxed\{((?:[^{}]|\{[^{}]*\})*)\}', response)
-    if matches:
-        pred = matches[-1].strip()
-    else:
+    pred = _last_boxed(response)
+    if pred is None:
         return ""
-    pred = re.sub(r"\n\s*", "", pred).lstrip(":").rstrip("./")
-    return pred
+    return NEWLINE_PATTERN.sub("", pred.strip()).lstrip(":").rstrip("./")
 
 
 @scorer(metrics=[accuracy(), stderr()])
@@ -67,7 +98,7 @@ def telemath(difficulty: str = "full"):
             lambda sample: sample.metadata.get("difficulty") == difficulty
         )
     
-    solver = [system_message(SYSTEM_PROMPT), generate()]
+    solver = [system_message(SYSTEM_PROMPT), generate(cache=True)]
     
     return Task(
         dataset=dataset,
@@ -1,3 +1,5 @@
+from string import ascii_uppercase
+
 from dotenv import load_dotenv
 from inspect_ai import Task, task
 from inspect_ai.dataset import Sample, hf_dataset
@@ -8,12 +10,19 @@ from inspect_ai.solver import multiple_choice
 load_dotenv()
 
 
+def _answer_letter(index: int) -> str:
+    # out-of-range indices keep chr()'s result, which matches no choice
+    if 0 <= index < len(ascii_uppercase):
+        return ascii_uppercase[index]
+    return chr(65 + index)
+
+
 def teleqna_record_to_sample(record):
     """Convert TeleQnA record to Inspect Sample with choices and metadata."""
     return Sample(
         input=record["question"],
         choices=record["choices"],
-        target=chr(65 + record["answer"]),
+        target=_answer_letter(record["answer"]),
         metadata={"subject": record.get("subject")}
     )
 
@@ -1,6 +1,7 @@
 from typing import Callable
 from functools import lru_cache, partial
 from pathlib import Path
+from inspect_ai.dataset import Dataset
 from inspect_ai.scorer import scorer, accuracy, stderr, model_graded_qa, multi_scorer, Scorer
 from inspect_ai.solver import TaskState
 from inspect_ai.model import Model
@@ -8,18 +9,23 @@ from inspect_ai.model import Model
 from .prompts import JUDGE_TEMPLATE, JUDGE_INSTRUCTIONS, SCORE_PATTERN
 
 
-@lru_cache
+RUBRICS_DIR = Path(__file__).parent / "rubrics"
+
+
+@lru_cache(maxsize=None)
 def get_rubric(category: str) -> str:
-    """Load rubric content based on category."""
-    path = Path(__file__).parent / "rubrics" / f"{category.lower().replace(' ', '_')}.txt"
+    """Load rubric content based on category, read once per category."""
+    path = RUBRICS_DIR / f"{category.lower().replace(' ', '_')}.txt"
+    if not path.is_file():
+        raise ValueError(f"No rubric for category: {category}")
     return path.read_text()
 
 
-def assign_rubrics(dataset_samples: list) -> list:
-    """Attach rubrics to dataset samples based on category."""
-    for sample in dataset_samples:
+def assign_rubrics(dataset: Dataset) -> Dataset:
+    """Attach rubrics to dataset samples in place based on category."""
+    for sample in dataset:
         sample.metadata["rubric"] = get_rubric(sample.metadata["Category"])
-    return dataset_samples
+    return dataset
 
 
 @scorer(metrics=[accuracy(), stderr()])
@@ -42,8 +42,8 @@ def teleyaml() -> Task:
     ]
 
     return Task(
-        dataset=assign_rubrics(list(dataset)),
-        solver=[system_message(SYSTEM_PROMPT), generate()],
+        dataset=assign_rubrics(dataset),
+        solver=[system_message(SYSTEM_PROMPT), generate(cache=True)],
         scorer=judge(model=judge_models),
         metrics=[accuracy(), stderr()],
     )
\ No newline at end of file
@@ -1,3 +1,4 @@
+from string import ascii_uppercase
 from textwrap import dedent
 
 from dotenv import load_dotenv
@@ -15,11 +16,18 @@ SYSTEM_PROMPT = dedent("""
     """)
 
 
+def _answer_letter(index: int) -> str:
+    # out-of-range indices keep chr()'s result, which matches no choice
+    if 0 <= index < len(ascii_uppercase):
+        return ascii_uppercase[index]
+    return chr(65 + index)
+
+
 def three_gpp_record_to_sample(record):
     return Sample(
         input=record["input"],
         choices=record["choices"],
-        target=chr(65 + int(record["index"])),
+        target=_answer_letter(int(record["index"])),
     )
 
 
@@ -1,20 +1,47 @@
+import errno
 import os
+import shutil
 import sys
 import subprocess
 import json
+import logging
 import time
 import uuid
 import threading
-from collections import deque
+import selectors
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, List
-from flask import Flask, render_template, request, jsonify, Response
-from threading import Thread
-from queue import Queue, Empty
+from queue import Empty, SimpleQueue
+from typing import Any, Dict, Optional, List, Tuple
+from urllib.parse import quote
+from flask import Flask, render_template, request, jsonify, Response, send_file
+from werkzeug.security import safe_join
+
+try:
+    import pty
+except ImportError:  # pty is POSIX-only, fall back to a pipe and a reader thread
+    pty = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, the stdlib decoder works the same
+    _json_loads = json.loads
 
 app = Flask(__name__)
 
+logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
+logger = logging.getLogger("open_telco.ui")
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT_DIR / "src"
+LOGS_DIRS = (SRC_DIR / "logs", ROOT_DIR / "logs")
+# Behind nginx, set LOGS_ACCEL_PREFIX to an internal location aliased to the
+# repository root and log downloads are handed off with X-Accel-Redirect:
+#   location /_protected_logs/ { internal; alias /path/to/open_telco/; }
+LOGS_ACCEL_PREFIX = os.environ.get("LOGS_ACCEL_PREFIX", "").rstrip("/")
+
 TASK_FILES: Dict[str, str] = {
     "telemath": "benchmarks/telemath/telemath.py",
     "teleqna": "benchmarks/teleqna/teleqna.py",
@@ -27,53 +54,101 @@ TASK_ALIASES: Dict[str, str] = {
     "telelogs_bench": "telelogs",
 }
 
-# Try to find inspect command - check environment variable first, then common locations
-INSPECT_CMD = os.environ.get("INSPECT_CMD")
+# Try to find inspect command - check environment variable first, then PATH,
+# then common install locations. Only the filesystem is probed, so importing
+# the app never forks.
+INSPECT_CMD = os.environ.get("INSPECT_CMD") or shutil.which("inspect")
 if not INSPECT_CMD:
-    # Try common locations
     possible_cmds = [
-        "inspect",  # If in PATH
         str(Path.home() / ".local/bin/inspect"),  # Common user install location
         "/usr/local/bin/inspect",  # Homebrew on Intel Mac
         "/opt/homebrew/bin/inspect",  # Homebrew on Apple Silicon
     ]
     for cmd in possible_cmds:
-        try:
-            result = subprocess.run([cmd, "--version"], capture_output=True, timeout=2)
-            if result.returncode == 0:
-                INSPECT_CMD = cmd
-                print(f"Found inspect at: {cmd}")
-                break
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            continue
-    
+        if os.path.isfile(cmd) and os.access(cmd, os.X_OK):
+            INSPECT_CMD = cmd
+            logger.info("Found inspect at: %s", cmd)
+            break
+
     if not INSPECT_CMD:
-        print("WARNING: inspect command not found. Set INSPECT_CMD environment variable.")
-        print("Install inspect_ai: pip install inspect-ai")
+        logger.warning(
+            "inspect command not found. Set INSPECT_CMD environment variable. "
+            "Install inspect_ai: pip install inspect-ai"
+        )
         INSPECT_CMD = "inspect"  # Fallback
 
 INSPECT_BASE_CMD: List[str] = [INSPECT_CMD]
 
 RUNS_REGISTRY: Dict[str, Dict[str, Any]] = {}
-REGISTRY_LOCK = threading.Lock()
+# Registry reads are lock-free: a dict lookup is atomic under the GIL and
+# readers copy run["models"] with list() before iterating. The write lock only
+# serialises inserts, and job fields are guarded by each job's own lock.
+REGISTRY_WRITE_LOCK = threading.Lock()
 MAX_LOG_LINES = 200
+EVENTS_HEARTBEAT_SECONDS = 15
+# While a job is running the full status is resent at this interval, so the
+# elapsed time and ETA keep moving between progress changes
+EVENTS_REFRESH_SECONDS = 2
+TERMINAL_RUN_STATUSES = {'complete', 'failed', 'cancelled'}
+# How long cancelled jobs get to exit after SIGTERM before they are killed
+CANCEL_GRACE_SECONDS = 2
+# Top-level keys of inspect's JSON output that _apply_results reads
+PROGRESS_KEYS = frozenset({"results", "progress", "sample", "event"})
+
+# Output of all running jobs is read by one supervisor thread; jobs are handed
+# to it through OUTPUT_QUEUE and the thread is started on first use.
+OUTPUT_QUEUE: "SimpleQueue[tuple]" = SimpleQueue()
+OUTPUT_SUPERVISOR: Optional[threading.Thread] = None
+OUTPUT_SUPERVISOR_LOCK = threading.Lock()
+OUTPUT_READ_SIZE = 65536
+OUTPUT_POLL_SECONDS = 0.05
+# Progress notifications per job are coalesced into windows of this length;
+# status transitions always notify immediately.
+NOTIFY_MIN_INTERVAL = 0.05
+
+# list_logs results, reused while the log directories' mtimes are unchanged.
+# Rewriting an existing log in place does not touch the directory mtime, so
+# entries also expire after a few seconds to pick up new sizes.
+LOGS_CACHE: Dict[str, Any] = {}
+LOGS_CACHE_LOCK = threading.Lock()
+LOGS_CACHE_SECONDS = 5
 
 
 def _now() -> float:
+    """Wall-clock time, for timestamps shown to users."""
     return time.time()
 
 
+def _monotonic() -> float:
+    """Monotonic clock, for elapsed time and ETA arithmetic."""
+    return time.monotonic()
+
+
 def _iso_timestamp(timestamp: Optional[float]) -> Optional[str]:
     if not timestamp:
         return None
+    return _iso_timestamp_cached(timestamp)
+
+
+def _format_iso(timestamp: float) -> str:
     dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
     return dt.isoformat()
 
 
+# Run and job start/finish timestamps are fixed once set, so repeated polls
+# hit the cache. Values that change on every output line, like a run's
+# updated_at, go through _format_iso directly.
+_iso_timestamp_cached = lru_cache(maxsize=8192)(_format_iso)
+
+
 def _format_duration(seconds: Optional[float]) -> Optional[str]:
     if seconds is None:
         return None
-    total = int(max(0, seconds))
+    return _format_whole_seconds(int(max(0, seconds)))
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(total: int) -> str:
     hours, remainder = divmod(total, 3600)
     minutes, secs = divmod(remainder, 60)
     parts: List[str] = []
@@ -107,22 +182,14 @@ def _resolve_task_name(task_name: str) -> str:
     return resolved
 
 
-def _estimate_remaining(job: Dict[str, Any]) -> Optional[float]:
+def _estimate_remaining(job: Dict[str, Any], elapsed: Optional[float]) -> Optional[float]:
     completed = job.get("samples_completed", 0)
     total = job.get("total_samples")
     if not completed:
         return None
     if not total:
         return None
-    started_at = job.get("started_at")
-    if not started_at:
-        return None
-    end_point = _now()
-    finished_at = job.get("finished_at")
-    if finished_at:
-        end_point = finished_at
-    elapsed = end_point - started_at
-    if elapsed <= 0:
+    if elapsed is None or elapsed <= 0:
         return None
     remaining = total - completed
     if remaining <= 0:
@@ -131,6 +198,24 @@ def _estimate_remaining(job: Dict[str, Any]) -> Optional[float]:
     return remaining * average
 
 
+def _snapshot_timing(job: Dict[str, Any]) -> Dict[str, Any]:
+    started_at = job.get("started_at_mono")
+    finished_at = job.get("finished_at_mono")
+    end_point = finished_at if finished_at is not None else _monotonic()
+    elapsed = None
+    if started_at is not None:
+        elapsed = end_point - started_at
+
+    eta_seconds = _estimate_remaining(job, elapsed)
+
+    return {
+        "elapsed_seconds": elapsed,
+        "elapsed": _format_duration(elapsed),
+        "eta_seconds": eta_seconds,
+        "eta": _format_duration(eta_seconds),
+    }
+
+
 def _snapshot_job(job: Dict[str, Any]) -> Dict[str, Any]:
     completed = job.get("samples_completed", 0)
     total_samples = job.get("total_samples")
@@ -139,17 +224,6 @@ def _snapshot_job(job: Dict[str, Any]) -> Dict[str, Any]:
     if ratio is not None:
         progress_percent = round(ratio * 100, 2)
 
-    started_at = job.get("started_at")
-    end_point = _now()
-    finished_at = job.get("finished_at")
-    if finished_at:
-        end_point = finished_at
-    elapsed = None
-    if started_at:
-        elapsed = end_point - started_at
-
-    eta_seconds = _estimate_remaining(job)
-
     return {
         "job_id": job.get("job_id"),
         "model": job.get("model"),
@@ -159,73 +233,147 @@ def _snapshot_job(job: Dict[str, Any]) -> Dict[str, Any]:
         "samples_completed": completed,
         "total_samples": total_samples,
         "progress_percent": progress_percent,
-        "elapsed_seconds": elapsed,
-        "elapsed": _format_duration(elapsed),
-        "eta_seconds": eta_seconds,
-        "eta": _format_duration(eta_seconds),
+        **_snapshot_timing(job),
         "error": job.get("error"),
-        "started_at": _iso_timestamp(started_at),
-        "finished_at": _iso_timestamp(finished_at),
+        "started_at": _iso_timestamp(job.get("started_at")),
+        "finished_at": _iso_timestamp(job.get("finished_at")),
         "returncode": job.get("returncode"),
     }
 
 
-def _apply_results(job: Dict[str, Any], payload: Dict[str, Any]) -> None:
-    results = payload.get("results")
-    if isinstance(results, dict):
-        total = results.get("total_samples")
-        if total is not None:
-            job["total_samples"] = total
-        completed = results.get("completed_samples")
-        if completed is not None:
-            job["samples_completed"] = completed
+def _cached_snapshot(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the job's snapshot, rebuilding it only after the job changed.
 
-    progress = payload.get("progress")
-    if isinstance(progress, dict):
-        total = progress.get("total")
-        if total is not None:
-            job["total_samples"] = total
-        completed = progress.get("completed")
-        if completed is not None:
-            job["samples_completed"] = completed
+    Callers that mutate snapshot fields reset job["snapshot"] to None. While
+    a job is running only its elapsed time and ETA are recomputed.
+    """
+    snapshot = job.get("snapshot")
+    if snapshot is None:
+        snapshot = job["snapshot"] = _snapshot_job(job)
+    elif job.get("started_at") and not job.get("finished_at"):
+        snapshot = {**snapshot, **_snapshot_timing(job)}
+    return snapshot
 
-    sample = payload.get("sample")
-    if isinstance(sample, dict):
-        total = sample.get("total")
-        if total is not None:
-            job["total_samples"] = total
-        completed = sample.get("completed")
-        if isinstance(completed, int):
-            if completed > job.get("samples_completed", 0):
-                job["samples_completed"] = completed
-        index = sample.get("index")
-        if isinstance(index, int):
-            candidate = index + 1
-            if candidate > job.get("samples_completed", 0):
-                job["samples_completed"] = candidate
-
-    event = payload.get("event")
-    if event in {"sample_complete", "sample_success", "sample"}:
+
+def _set_counts(job: Dict[str, Any], total: Any, completed: Any) -> None:
+    if total is not None:
+        job["total_samples"] = total
+    if completed is not None:
+        job["samples_completed"] = completed
+
+
+def _apply_results_section(job: Dict[str, Any], results: Dict[str, Any]) -> None:
+    _set_counts(job, results.get("total_samples"), results.get("completed_samples"))
+
+
+def _apply_progress_section(job: Dict[str, Any], progress: Dict[str, Any]) -> None:
+    _set_counts(job, progress.get("total"), progress.get("completed"))
+
+
+def _apply_sample_section(job: Dict[str, Any], sample: Dict[str, Any]) -> None:
+    total = sample.get("total")
+    if total is not None:
+        job["total_samples"] = total
+    best = job.get("samples_completed", 0)
+    completed = sample.get("completed")
+    if isinstance(completed, int) and completed > best:
+        best = completed
+    index = sample.get("index")
+    if isinstance(index, int) and index + 1 > best:
+        best = index + 1
+    job["samples_completed"] = best
+
+
+# Applied in this order, so a sample section can only raise the count set by
+# results/progress in the same payload
+PROGRESS_SECTION_HANDLERS = (
+    ("results", _apply_results_section),
+    ("progress", _apply_progress_section),
+    ("sample", _apply_sample_section),
+)
+SAMPLE_EVENTS = {"sample_complete", "sample_success", "sample"}
+
+
+def _apply_results(job: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    for key, handler in PROGRESS_SECTION_HANDLERS:
+        if key not in payload:
+            continue
+        section = payload[key]
+        if isinstance(section, dict):
+            handler(job, section)
+
+    if payload.get("event") in SAMPLE_EVENTS:
         completed = payload.get("completed")
         if isinstance(completed, int) and completed > job.get("samples_completed", 0):
             job["samples_completed"] = completed
 
 
-def _handle_progress(job: Dict[str, Any], raw_line: str) -> None:
+def _notify_run(run: Dict[str, Any]) -> None:
+    """Wake up event streams watching this run."""
+    cond = run["cond"]
+    with cond:
+        run["version"] += 1
+        cond.notify_all()
+
+
+def _notify_progress(run: Dict[str, Any], job: Dict[str, Any]) -> None:
+    """Notify a job's progress change, at most once per NOTIFY_MIN_INTERVAL.
+
+    Changes inside the window are flagged as pending and flushed by the
+    output supervisor once the window has passed.
+    """
+    now = _monotonic()
+    if now - job["last_emit"] < NOTIFY_MIN_INTERVAL:
+        job["emit_pending"] = True
+        return
+    job["last_emit"] = now
+    job["emit_pending"] = False
+    _notify_run(run)
+
+
+def _tail_as_list(job: Dict[str, Any]) -> List[str]:
+    """Decode the job's buffered output lines, oldest first."""
+    tail = job.get("log_tail")
+    if not tail:
+        return []
+    index = job["log_tail_idx"]
+    if index > MAX_LOG_LINES:
+        lines = tail[index % MAX_LOG_LINES:] + tail[:index % MAX_LOG_LINES]
+    else:
+        lines = tail[:index]
+    return [line.decode(errors="replace") for line in lines]
+
+
+def _handle_progress(job: Dict[str, Any], raw_line: bytes) -> bool:
+    """Record a line of job output, returning True if the job's progress changed."""
     job["last_update"] = _now()
     if "log_tail" not in job:
-        job["log_tail"] = deque(maxlen=MAX_LOG_LINES)
-    job["log_tail"].append(raw_line.rstrip())
+        job["log_tail"] = [None] * MAX_LOG_LINES
+        job["log_tail_idx"] = 0
+    # raw bytes go into a fixed ring; they are only decoded when read back
+    index = job["log_tail_idx"]
+    job["log_tail"][index % MAX_LOG_LINES] = raw_line.rstrip()
+    job["log_tail_idx"] = index + 1
+    # most output is plain log text, so skip the decode unless it can be an object
+    line = raw_line.lstrip()
+    if not line.startswith(b"{"):
+        return False
     try:
-        payload = json.loads(raw_line)
-    except json.JSONDecodeError:
-        return
-    if not isinstance(payload, dict):
-        return
+        payload = _json_loads(line)
+    except ValueError:
+        return False
+    if not isinstance(payload, dict) or PROGRESS_KEYS.isdisjoint(payload):
+        return False
+    before = (job.get("samples_completed"), job.get("total_samples"))
     _apply_results(job, payload)
+    if (job.get("samples_completed"), job.get("total_samples")) == before:
+        return False
+    job["snapshot"] = None
+    return True
 
 
-def _build_command(task_name: str, model: str, options: Dict[str, Any]) -> List[str]:
+def _build_base_command(task_name: str, options: Dict[str, Any]) -> Tuple[str, ...]:
+    """Build the inspect command shared by every job in a run; jobs append --model."""
     resolved_task = _resolve_task_name(task_name)
     task_file = TASK_FILES[resolved_task]
     cmd = INSPECT_BASE_CMD + [
@@ -239,12 +387,7 @@ def _build_command(task_name: str, model: str, options: Dict[str, Any]) -> List[
         "info",
         "--log-format",
         "json",
-        "--model",
-        model,
     ]
-    
-    print(f"[DEBUG] Building command for model: {model}")
-    print(f"[DEBUG] Task: {resolved_task}, File: {task_file}")
 
     difficulty = options.get("difficulty")
     if difficulty and resolved_task == "telemath" and difficulty != "full":
@@ -266,106 +409,249 @@ def _build_command(task_name: str, model: str, options: Dict[str, Any]) -> List[
     if temperature is not None and temperature != "":
         cmd.extend(["--temperature", str(temperature)])
 
-    print(f"[DEBUG] Full command: {' '.join(cmd)}")
-    return cmd
+    logger.debug("Base command: %s", cmd)
+    return tuple(cmd)
+
+
+def _register_output(selector: selectors.BaseSelector, item: tuple) -> None:
+    run, job, stream, closed = item
+    try:
+        os.set_blocking(stream.fileno(), False)
+        selector.register(stream, selectors.EVENT_READ, data=(run, job, closed, bytearray()))
+    except Exception as exc:
+        # release the waiting worker rather than taking the supervisor down
+        logger.exception("Watching output of job %s failed: %s", job.get("job_id"), exc)
+        try:
+            stream.close()
+        except OSError:
+            pass
+        closed.set()
+
+
+def _close_output(selector: selectors.BaseSelector, key: selectors.SelectorKey) -> None:
+    selector.unregister(key.fileobj)
+    key.fileobj.close()
+    key.data[2].set()
+
+
+def _read_output(key: selectors.SelectorKey) -> bool:
+    """Read whatever the job has written, returning False once the stream is done."""
+    run, job, _, pending = key.data
+    return _consume_output(run, job, key.fd, pending)
+
+
+def _consume_output(run: Dict[str, Any], job: Dict[str, Any], fd: int, pending: bytearray) -> bool:
+    try:
+        chunk = os.read(fd, OUTPUT_READ_SIZE)
+    except OSError as exc:
+        # a pty master reports EIO instead of EOF once the child has exited
+        if exc.errno != errno.EIO:
+            raise
+        chunk = b""
+    if job.get("cancel_requested"):
+        return False
+    if chunk:
+        pending.extend(chunk)
+        *lines, rest = bytes(pending).split(b"\n")
+        pending[:] = rest
+    else:
+        lines = [bytes(pending)] if pending else []
+    changed = False
+    with job["lock"]:
+        for line in lines:
+            changed |= _handle_progress(job, line)
+    if changed or job["emit_pending"]:
+        _notify_progress(run, job)
+    return bool(chunk)
+
+
+def _output_supervisor() -> None:
+    """Multiplex the output of every running job through a single selector."""
+    selector = selectors.DefaultSelector()
+    while True:
+        if not selector.get_map():
+            _register_output(selector, OUTPUT_QUEUE.get())
+        while True:
+            try:
+                _register_output(selector, OUTPUT_QUEUE.get_nowait())
+            except Empty:
+                break
+        for key, _ in selector.select(timeout=OUTPUT_POLL_SECONDS):
+            try:
+                keep_reading = _read_output(key)
+            except BlockingIOError:
+                continue
+            except Exception as exc:
+                logger.exception("Reading job output failed: %s", exc)
+                keep_reading = False
+            if not keep_reading:
+                _close_output(selector, key)
+        for key in list(selector.get_map().values()):
+            run, job = key.data[:2]
+            if job["emit_pending"]:
+                _notify_progress(run, job)
+
+
+def _pump_output(run: Dict[str, Any], job: Dict[str, Any], stream: Any, closed: threading.Event) -> None:
+    """Read one job's output with blocking reads on its own thread.
+
+    Used where pty is unavailable (Windows): there the selector cannot
+    watch pipes, so the supervisor is bypassed.
+    """
+    pending = bytearray()
+    try:
+        while _consume_output(run, job, stream.fileno(), pending):
+            pass
+    except Exception as exc:
+        logger.exception("Reading job output failed: %s", exc)
+    finally:
+        stream.close()
+        closed.set()
+
+
+def _watch_output(run: Dict[str, Any], job: Dict[str, Any], stream: Any) -> threading.Event:
+    """Hand a job's output stream to the supervisor; the event is set once it closes."""
+    global OUTPUT_SUPERVISOR
+    if pty is None:
+        closed = threading.Event()
+        threading.Thread(
+            target=_pump_output, args=(run, job, stream, closed), daemon=True
+        ).start()
+        return closed
+    with OUTPUT_SUPERVISOR_LOCK:
+        if OUTPUT_SUPERVISOR is None:
+            OUTPUT_SUPERVISOR = threading.Thread(target=_output_supervisor, daemon=True)
+            OUTPUT_SUPERVISOR.start()
+    closed = threading.Event()
+    OUTPUT_QUEUE.put((run, job, stream, closed))
+    return closed
 
 
 def _run_inspect_job(run_id: str, job_id: str, task_name: str, command: List[str]) -> None:
-    process: Optional[subprocess.Popen[str]] = None
+    process: Optional[subprocess.Popen[bytes]] = None
+    run = RUNS_REGISTRY.get(run_id)
+    job = run["models"].get(job_id) if run else None
+    if not run or not job:
+        return
+
     try:
-        with REGISTRY_LOCK:
-            run = RUNS_REGISTRY.get(run_id)
-            if not run:
-                return
-            job = run["models"].get(job_id)
-            if not job:
-                return
-            job["status"] = "running"
-            job["started_at"] = _now()
+        with job["lock"]:
+            cancelled = job.get("cancel_requested")
+            if cancelled:
+                job["status"] = "cancelled"
+                job["finished_at"] = _now()
+                job["finished_at_mono"] = _monotonic()
+            else:
+                job["status"] = "running"
+                job["started_at"] = _now()
+                job["started_at_mono"] = _monotonic()
+            job["snapshot"] = None
+        _notify_run(run)
+        if cancelled:
+            return
 
         env = os.environ.copy()
         env["PYTHONUNBUFFERED"] = "1"
         env["BUILDKIT_PROGRESS"] = "plain"
         env["DOCKER_BUILDKIT"] = "1"
 
-        src_dir = Path(__file__).parent.parent / "src"
-        process = subprocess.Popen(
-            command,
-            cwd=str(src_dir),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
-            env=env,
-        )
-
-        with REGISTRY_LOCK:
-            run = RUNS_REGISTRY.get(run_id)
-            if run:
-                job = run["models"].get(job_id)
-                if job:
-                    job["process"] = process
-
-        stream = process.stdout
-        if stream is None:
-            return_code = process.wait()
+        # Give the child a terminal where available so it line-buffers its
+        # output, as it would when run interactively
+        if pty is not None:
+            # isatty() is true for the whole child tree, so ask for plain
+            # output to keep escape codes out of the log tail
+            env["NO_COLOR"] = "1"
+            env["TERM"] = "dumb"
+            master_fd, output = pty.openpty()
+            stream = os.fdopen(master_fd, "rb", buffering=0)
         else:
-            for raw_line in iter(stream.readline, ""):
-                with REGISTRY_LOCK:
-                    run = RUNS_REGISTRY.get(run_id)
-                    if not run:
-                        continue
-                    job = run["models"].get(job_id)
-                    if not job:
-                        continue
-                    if job.get("cancel_requested"):
-                        break
-                    _handle_progress(job, raw_line)
+            output = subprocess.PIPE
+            stream = None
+        try:
+            process = subprocess.Popen(
+                command,
+                cwd=str(SRC_DIR),
+                stdout=output,
+                stderr=subprocess.STDOUT,
+                env=env,
+            )
+        except Exception:
+            if stream is not None:
+                stream.close()
+            raise
+        finally:
+            if stream is not None:
+                os.close(output)
+        if stream is None:
+            stream = process.stdout
 
-            stream.close()
-            return_code = process.wait()
+        with job["lock"]:
+            job["process"] = process
+            cancelled = job.get("cancel_requested")
+        # a cancel that arrived while the process was starting did not see it
+        if cancelled:
+            _terminate_in_background([process])
+
+        if stream is not None:
+            _watch_output(run, job, stream).wait()
+        return_code = process.wait()
 
     except Exception as exc:
-        print(f"[ERROR] Job {job_id} failed with exception: {exc}")
-        import traceback
-        traceback.print_exc()
-        with REGISTRY_LOCK:
-            run = RUNS_REGISTRY.get(run_id)
-            if not run:
-                return
-            job = run["models"].get(job_id)
-            if not job:
-                return
+        logger.exception("Job %s failed with exception: %s", job_id, exc)
+        with job["lock"]:
             job["status"] = "failed"
             job["error"] = str(exc)
             job["finished_at"] = _now()
+            job["finished_at_mono"] = _monotonic()
             job["process"] = None
+            job["snapshot"] = None
+        _notify_run(run)
         return
 
-    with REGISTRY_LOCK:
-        run = RUNS_REGISTRY.get(run_id)
-        if not run:
-            return
-        job = run["models"].get(job_id)
-        if not job:
-            return
+    with job["lock"]:
         job["process"] = None
         job["returncode"] = return_code
         job["finished_at"] = _now()
+        job["finished_at_mono"] = _monotonic()
+        job["snapshot"] = None
         if job.get("cancel_requested"):
             job["status"] = "cancelled"
-            return
-        if return_code == 0:
+        elif return_code == 0:
             job["status"] = "complete"
-            return
-        job["status"] = "failed"
-        error_msg = f"Exited with code {return_code}"
-        print(f"[ERROR] Job {job_id} failed: {error_msg}")
-        print(f"[ERROR] Last log lines:")
-        for line in job.get("log_tail", []):
-            print(f"  {line}")
-        job["error"] = error_msg
+        else:
+            job["status"] = "failed"
+            error_msg = f"Exited with code {return_code}"
+            logger.error(
+                "Job %s failed: %s\nLast log lines:\n%s",
+                job_id,
+                error_msg,
+                "\n".join(f"  {line}" for line in _tail_as_list(job)),
+            )
+            job["error"] = error_msg
+    _notify_run(run)
+
+
+def _terminate_processes(processes: List[subprocess.Popen]) -> None:
+    """Send SIGTERM to each process, then SIGKILL any still alive after the grace period."""
+    for process in processes:
+        try:
+            process.terminate()
+        except OSError:
+            pass
+    deadline = _monotonic() + CANCEL_GRACE_SECONDS
+    for process in processes:
+        try:
+            process.wait(timeout=max(0.0, deadline - _monotonic()))
+        except subprocess.TimeoutExpired:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+
+def _terminate_in_background(processes: List[subprocess.Popen]) -> None:
+    if processes:
+        threading.Thread(target=_terminate_processes, args=(processes,), daemon=True).start()
 
 
 def _register_run(run_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -390,9 +676,12 @@ def _register_run(run_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         "created_at": _now(),
         "options": options,
         "models": {},
+        "cond": threading.Condition(),
+        "version": 0,
+        "base_cmd": _build_base_command(task, options),
     }
 
-    with REGISTRY_LOCK:
+    with REGISTRY_WRITE_LOCK:
         RUNS_REGISTRY[run_id] = run_entry
 
     for model_info in models_payload:
@@ -413,17 +702,24 @@ def _register_run(run_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
             "error": None,
             "started_at": None,
             "finished_at": None,
+            "started_at_mono": None,
+            "finished_at_mono": None,
             "process": None,
             "cancel_requested": False,
             "returncode": None,
-            "log_tail": deque(maxlen=MAX_LOG_LINES),
+            "log_tail": [None] * MAX_LOG_LINES,
+            "log_tail_idx": 0,
+            "lock": threading.Lock(),
+            "snapshot": None,
+            "last_emit": 0.0,
+            "emit_pending": False,
         }
-        with REGISTRY_LOCK:
+        with REGISTRY_WRITE_LOCK:
             retrieved_run = RUNS_REGISTRY.get(run_id)
             if retrieved_run is None:
                 continue
             retrieved_run["models"][job_id] = job
-        command = _build_command(task, model_name, options)
+        command = [*run_entry["base_cmd"], "--model", model_name]
         worker = threading.Thread(
             target=_run_inspect_job,
             args=(run_id, job_id, task, command),
@@ -444,19 +740,18 @@ def create_run():
     except ValueError as exc:
         return jsonify({'error': str(exc)}), 400
 
-    with REGISTRY_LOCK:
-        run = RUNS_REGISTRY.get(run_id)
-        if not run:
-            return jsonify({'error': 'Run registration failed'}), 500
-        models_snapshot = [
-            {
-                'job_id': job['job_id'],
-                'model': job['model'],
-                'display_name': job.get('display_name'),
-                'provider': job.get('provider'),
-            }
-            for job in run['models'].values()
-        ]
+    run = RUNS_REGISTRY.get(run_id)
+    if not run:
+        return jsonify({'error': 'Run registration failed'}), 500
+    models_snapshot = [
+        {
+            'job_id': job['job_id'],
+            'model': job['model'],
+            'display_name': job.get('display_name'),
+            'provider': job.get('provider'),
+        }
+        for job in list(run['models'].values())
+    ]
 
     response = {
         'run_id': run_id,
@@ -468,23 +763,28 @@ def create_run():
     return jsonify(response)
 
 
-@app.route('/api/runs/<run_id>/status')
-def run_status(run_id: str):
-    with REGISTRY_LOCK:
-        run = RUNS_REGISTRY.get(run_id)
-        if not run:
-            return jsonify({'error': 'Run not found'}), 404
-        snapshots = [_snapshot_job(job) for job in run['models'].values()]
-        total_jobs = len(snapshots)
-        completed = sum(1 for item in snapshots if item['status'] == 'complete')
-        failed = sum(1 for item in snapshots if item['status'] == 'failed')
-        cancelled = sum(1 for item in snapshots if item['status'] == 'cancelled')
-        running_jobs = sum(1 for item in snapshots if item['status'] == 'running')
-        queued_jobs = sum(1 for item in snapshots if item['status'] == 'queued')
-        last_update_candidates = [run['created_at']]
-        last_update_candidates.extend(
-            job.get('last_update') for job in run['models'].values() if job.get('last_update')
-        )
+def _run_status_payload(run_id: str) -> Optional[Dict[str, Any]]:
+    run = RUNS_REGISTRY.get(run_id)
+    if not run:
+        return None
+    snapshots = []
+    tally = {'complete': 0, 'failed': 0, 'cancelled': 0, 'running': 0, 'queued': 0}
+    last_update = run['created_at']
+    for job in list(run['models'].values()):
+        with job['lock']:
+            snapshot = _cached_snapshot(job)
+            job_update = job.get('last_update')
+        snapshots.append(snapshot)
+        if snapshot['status'] in tally:
+            tally[snapshot['status']] += 1
+        if job_update and job_update > last_update:
+            last_update = job_update
+    total_jobs = len(snapshots)
+    completed = tally['complete']
+    failed = tally['failed']
+    cancelled = tally['cancelled']
+    running_jobs = tally['running']
+    queued_jobs = tally['queued']
 
     overall_status = 'running'
     if total_jobs == 0:
@@ -498,13 +798,11 @@ def run_status(run_id: str):
     if running_jobs == 0 and queued_jobs == total_jobs and total_jobs:
         overall_status = 'queued'
 
-    last_update = max(filter(None, last_update_candidates)) if last_update_candidates else None
-
-    response = {
+    return {
         'run_id': run_id,
         'task': run['task'],
         'created_at': _iso_timestamp(run['created_at']),
-        'updated_at': _iso_timestamp(last_update),
+        'updated_at': _format_iso(last_update),
         'overall': {
             'total': total_jobs,
             'complete': completed,
@@ -516,27 +814,65 @@ def run_status(run_id: str):
         },
         'models': snapshots,
     }
+
+
+@app.route('/api/runs/<run_id>/status')
+def run_status(run_id: str):
+    response = _run_status_payload(run_id)
+    if response is None:
+        return jsonify({'error': 'Run not found'}), 404
     return jsonify(response)
 
 
+@app.route('/api/runs/<run_id>/events')
+def run_events(run_id: str):
+    """Push run status over SSE whenever a job's progress or status changes."""
+    run = RUNS_REGISTRY.get(run_id)
+    if not run:
+        return jsonify({'error': 'Run not found'}), 404
+
+    def generate():
+        cond = run['cond']
+        seen_version = None
+        running = False
+        while True:
+            with cond:
+                changed = cond.wait_for(
+                    lambda: run['version'] != seen_version,
+                    timeout=EVENTS_REFRESH_SECONDS if running else EVENTS_HEARTBEAT_SECONDS,
+                )
+                seen_version = run['version']
+            if not changed and not running:
+                yield ": heartbeat\n\n"
+                continue
+            payload = _run_status_payload(run_id)
+            if payload is None:
+                return
+            yield f"data: {json.dumps(payload)}\n\n"
+            if payload['overall']['status'] in TERMINAL_RUN_STATUSES:
+                return
+            running = payload['overall']['running'] > 0
+
+    return Response(generate(), mimetype='text/event-stream')
+
+
 @app.route('/api/runs/<run_id>/cancel', methods=['POST'])
 def cancel_run(run_id: str):
-    with REGISTRY_LOCK:
-        run = RUNS_REGISTRY.get(run_id)
-        if not run:
-            return jsonify({'error': 'Run not found'}), 404
-        for job in run['models'].values():
+    run = RUNS_REGISTRY.get(run_id)
+    if not run:
+        return jsonify({'error': 'Run not found'}), 404
+    processes = []
+    for job in list(run['models'].values()):
+        with job['lock']:
             job['cancel_requested'] = True
             job['status'] = 'cancelling'
+            job['snapshot'] = None
             process = job.get('process')
-            if not process:
-                continue
-            if process.poll() is not None:
-                continue
-            try:
-                process.terminate()
-            except Exception:
-                process.kill()
+        if process and process.poll() is None:
+            processes.append(process)
+    # signalling and waiting happen off the request thread
+    _terminate_in_background(processes)
+    _notify_run(run)
 
     return jsonify({'run_id': run_id, 'status': 'cancelling'})
 
@@ -551,10 +887,10 @@ def read_eval_log(log_path):
             timeout=10
         )
         if result.returncode == 0:
-            return json.loads(result.stdout)
+            return _json_loads(result.stdout)
         return None
     except Exception as e:
-        print(f"Error reading log: {e}")
+        logger.error("Error reading log: %s", e)
         return None
 
 @app.route('/')
@@ -599,30 +935,22 @@ def run_evaluation():
     if data.get('temperature'):
         cmd.extend(['--temperature', str(data['temperature'])])
     
-    # Change to src directory
-    src_dir = Path(__file__).parent.parent / 'src'
-    
     try:
         # Run the command
         process = subprocess.Popen(
             cmd,
-            cwd=str(src_dir),
+            cwd=str(SRC_DIR),
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            bufsize=1
         )
         
-        # Read output
-        output = []
-        for line in process.stdout:
-            output.append(line)
-        
-        process.wait()
+        # Read all output in large chunks rather than line by line
+        output, _ = process.communicate()
         
         return jsonify({
             'success': True,
-            'output': ''.join(output),
+            'output': output,
             'returncode': process.returncode
         })
     
@@ -674,13 +1002,6 @@ def stream():
         if data.get('temperature'):
             cmd.extend(['--temperature', data['temperature']])
         
-        src_dir = Path(__file__).parent.parent / 'src'
-        
-        def enqueue_output(out, queue):
-            for line in iter(out.readline, ''):
-                queue.put(line)
-            out.close()
-        
         try:
             # Set environment to disable buffering
             env = os.environ.copy()
@@ -690,36 +1011,35 @@ def stream():
             
             process = subprocess.Popen(
                 cmd,
-                cwd=str(src_dir),
+                cwd=str(SRC_DIR),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 env=env,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=0
             )
             
-            # Use a queue and thread to read output asynchronously
-            q = Queue()
-            t = Thread(target=enqueue_output, args=(process.stdout, q))
-            t.daemon = True
-            t.start()
-            
-            # Yield output as it arrives
+            # Yield output as it arrives; this request's thread blocks on the
+            # pipe in large reads, so no reader thread or polling loop is needed
+            fd = process.stdout.fileno()
+            pending = b''
             while True:
-                try:
-                    line = q.get(timeout=0.1)
-                    yield f"data: {line}\n\n"
-                except Empty:
-                    # Check if process has finished
-                    if process.poll() is not None:
-                        # Get any remaining lines
-                        while not q.empty():
-                            try:
-                                line = q.get_nowait()
-                                yield f"data: {line}\n\n"
-                            except Empty:
-                                break
-                        break
+                chunk = os.read(fd, OUTPUT_READ_SIZE)
+                if not chunk:
+                    break
+                # splitlines treats \r, \n and \r\n as line ends, as text
+                # mode did; a bare \r inside a data line would end the event.
+                # A trailing \r is held back in case \n follows it.
+                lines = (pending + chunk).splitlines(keepends=True)
+                pending = b''
+                if lines and not lines[-1].endswith(b'\n'):
+                    pending = lines.pop()
+                for line in lines:
+                    text = line.rstrip(b'\r\n').decode(errors='replace')
+                    yield f"data: {text}\n\n\n"
+            if pending:
+                text = pending.rstrip(b'\r').decode(errors='replace')
+                yield f"data: {text}\n\n"
+            process.stdout.close()
             
             return_code = process.wait()
             yield f"data: \n[DONE] Exit code: {return_code}\n\n"
@@ -729,41 +1049,60 @@ def stream():
     
     return Response(generate(), mimetype='text/event-stream')
 
+def _dir_mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
 @app.route('/api/logs')
 def list_logs():
     """List all available JSON log files"""
-    src_logs_dir = Path(__file__).parent.parent / 'src' / 'logs'
-    root_logs_dir = Path(__file__).parent.parent / 'logs'
-    
+    key = tuple(_dir_mtime(logs_dir) for logs_dir in LOGS_DIRS)
+    with LOGS_CACHE_LOCK:
+        cached = LOGS_CACHE.get('result')
+        built_at = LOGS_CACHE.get('built_at')
+        fresh = built_at is not None and _monotonic() - built_at < LOGS_CACHE_SECONDS
+        if cached is not None and LOGS_CACHE.get('key') == key and fresh:
+            return jsonify(cached)
+
     logs = []
     
     # Check both log directories - ONLY JSON files
-    for logs_dir in [src_logs_dir, root_logs_dir]:
-        if logs_dir.exists():
-            for log_file in sorted(logs_dir.glob('*.json'), 
-                                   key=lambda x: x.stat().st_mtime, reverse=True):
-                logs.append({
-                    'name': log_file.name,
-                    'path': str(log_file),
-                    'size': log_file.stat().st_size,
-                    'modified': log_file.stat().st_mtime,
+    for logs_dir in LOGS_DIRS:
+        if not logs_dir.exists():
+            continue
+        entries = []
+        with os.scandir(logs_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append({
+                    'name': entry.name,
+                    'path': entry.path,
+                    'size': stat.st_size,
+                    'modified': stat.st_mtime,
                     'type': 'json'
                 })
+        entries.sort(key=lambda item: item['modified'], reverse=True)
+        logs.extend(entries)
     
+    with LOGS_CACHE_LOCK:
+        LOGS_CACHE.update(key=key, result=logs, built_at=_monotonic())
     return jsonify(logs)
 
 @app.route('/api/logs/<path:log_name>')
 def get_log(log_name):
     """Get detailed information about a specific JSON log file"""
-    src_logs_dir = Path(__file__).parent.parent / 'src' / 'logs'
-    root_logs_dir = Path(__file__).parent.parent / 'logs'
-    
     # Try to find the log file
     log_path = None
-    for logs_dir in [src_logs_dir, root_logs_dir]:
-        candidate = logs_dir / log_name
-        if candidate.exists():
-            log_path = candidate
+    for logs_dir in LOGS_DIRS:
+        # safe_join rejects names that would escape the logs directory
+        candidate = safe_join(str(logs_dir), log_name)
+        if candidate and os.path.isfile(candidate):
+            log_path = Path(candidate)
             break
     
     if not log_path:
@@ -773,10 +1112,18 @@ def get_log(log_name):
     if log_path.suffix != '.json':
         return jsonify({'error': 'Only JSON log files are supported. Please run evaluations with --log-format=json'}), 400
     
+    if LOGS_ACCEL_PREFIX:
+        # nginx sends the file itself; only headers go through the app
+        response = Response(mimetype='application/json')
+        response.headers['X-Accel-Redirect'] = (
+            f"{LOGS_ACCEL_PREFIX}/{quote(log_path.relative_to(ROOT_DIR).as_posix())}"
+        )
+        return response
+
+    # Serve the file as-is: no parse and re-encode, and conditional requests
+    # let the browser reuse a log it has already downloaded
     try:
-        with open(log_path, 'r') as f:
-            log_data = json.load(f)
-        return jsonify(log_data)
+        return send_file(log_path, mimetype='application/json', conditional=True)
     except Exception as e:
         return jsonify({'error': f'Failed to read JSON file: {str(e)}'}), 500
 